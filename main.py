@@ -1,4 +1,3 @@
-import asyncio
 import os
 import logging
 import argparse
@@ -10,9 +9,9 @@ logging.basicConfig(level=logging.INFO,
 logging.getLogger("telethon").setLevel(logging.ERROR)
 logger = logging.getLogger(__name__)
 
-async def main():
-    logger.info(f"Start at path {os.getcwd()}")
-    # 创建客户端
+
+def main():
+    # 配置和客户端都是懒加载的, 解析参数(包括 --help)时不会读配置也不会导入 telethon
     tools = TGTools()
     parser = tools.create_args()
 
@@ -22,9 +21,12 @@ async def main():
         sys.exit(1)
 
     args = parser.parse_args()
-    await tools.run_args(args)
+    logger.info(f"Start at path {os.getcwd()}")
+    # asyncio 也较重(约 30 ms), 只在真正执行命令时导入
+    import asyncio
+    asyncio.run(tools.run_args(args))
 
 
 # 运行脚本
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
@@ -1,18 +1,29 @@
 import argparse
 import logging
-from telethon import TelegramClient
+from functools import cached_property
 
-from . import utils
-from . import config as cfg
-from . import chat_media_downloader
+# telethon/yaml 及各子模块在命令真正执行时才导入, 保证 --help 等只解析参数的调用足够快
 logger = logging.getLogger(__name__)
 
 
 class TGTools:
-    def __init__(self):
-        self.config = cfg.load_config(cfg.CONFIG_PATH)
+    @cached_property
+    def config(self) -> dict:
+        """
+        首次访问时才读取配置并创建目录
+        """
+        from . import config as cfg
+        return cfg.load_config(cfg.CONFIG_PATH)
+
+    @cached_property
+    def client(self):
+        """
+        首次访问时才导入 telethon 并创建客户端
+        """
+        from telethon import TelegramClient
+        from . import config as cfg
         config = self.config
-        self.client = TelegramClient(cfg.SESSION_PATH, config["api_id"], config["api_hash"])
+        return TelegramClient(cfg.SESSION_PATH, config["api_id"], config["api_hash"])
 
     async def start(self):
         await self.client.start()
@@ -21,7 +32,7 @@ class TGTools:
         """
         展示所有对话
         """
-        # 创建客户端
+        from . import utils
         dialogs = await utils.get_dialogs(self.client)
         for dialog_id, name in dialogs.items():
             logger.info(f"{dialog_id} : {name}")
@@ -30,6 +41,7 @@ class TGTools:
         """
         清除所有私聊
         """
+        from . import utils
         reserved_chats: list[str] = args.reserved_chats  # 获取可选的名称列表
         reserved_set = set(reserved_chats) if reserved_chats else set()
         await utils.clear_all_personal_chats(self.client, reserved_set)
@@ -38,6 +50,7 @@ class TGTools:
         """
         下载媒体文件
         """
+        from . import chat_media_downloader
         await chat_media_downloader.download_by_config(self.client,self.config)
 
     def create_args(self):
@@ -0,0 +1,94 @@
+"""
+启动耗时基准: 多次执行 `python main.py --help`, 检查导入耗时预算, 以及 telethon/yaml/asyncio 没有被提前导入
+导入耗时为 `main.py --help` 所有顶层导入的累计耗时, 减去空解释器(`python -c pass`)的导入耗时
+用法: python startup_bench.py [--runs N] [--budget-ms MS]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+MAIN_PATH = Path(__file__).parent / "main.py"
+# 只解析参数时不应该导入的模块
+LAZY_MODULES = ("telethon", "yaml", "asyncio")
+# 懒加载后导入中位数实测约 16 ms(主要是 logging/argparse), asyncio 回到 main.py 顶层约 47 ms;
+# 多次实测偶有 25 ms 的抖动, 预算取 30 ms: 不会误报, asyncio 等重模块回到 --help 路径上仍会超出
+BUDGET_MS = 30.0
+
+
+class BenchError(Exception):
+    pass
+
+
+def positive_int(value: str) -> int:
+    result = int(value)
+    if result < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {value}")
+    return result
+
+
+def import_times(cmd: list[str], expect_usage: bool = True) -> tuple[dict[str, int], set[str]]:
+    """
+    用 -X importtime 执行命令
+    :return: (每个顶层模块的累计导入耗时(微秒), 导入过的所有模块名, 包括嵌套导入的)
+    :raises BenchError: 命令执行失败
+    """
+    proc = subprocess.run([sys.executable, "-X", "importtime", *cmd], capture_output=True, text=True)
+    # 命令崩溃时导入会提前中断, 耗时偏低, 不能当成功
+    if proc.returncode != 0 or (expect_usage and "usage:" not in proc.stdout):
+        stderr = "\n".join(line for line in proc.stderr.splitlines() if not line.startswith("import time:"))
+        raise BenchError(f"{' '.join(cmd)} exited with {proc.returncode}\n{stderr}")
+    top_level = {}
+    all_names = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        all_names.add(name.strip())
+        # 耗时只统计顶层模块, 子模块已经包含在累计耗时里
+        if name.startswith("  "):
+            continue
+        top_level[name.strip()] = int(cumulative)
+    return top_level, all_names
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CLI startup benchmark")
+    parser.add_argument("--runs", type=positive_int, default=10, help="执行次数")
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS, help="除空解释器外的导入耗时预算(毫秒)")
+    args = parser.parse_args()
+
+    cmd = [str(MAIN_PATH), "--help"]
+    wall_times = []
+    import_ms = []
+    bare_import_ms = []
+    try:
+        for _ in range(args.runs):
+            bare_times, _ = import_times(["-c", "pass"], expect_usage=False)
+            bare_import_ms.append(sum(bare_times.values()) / 1000)
+
+            start = time.perf_counter()
+            times, all_names = import_times(cmd)
+            wall_times.append((time.perf_counter() - start) * 1000)
+
+            eager = sorted(name for name in all_names if name.split(".")[0] in LAZY_MODULES)
+            if eager:
+                print(f"FAIL: modules imported eagerly: {eager}")
+                sys.exit(1)
+            import_ms.append(sum(times.values()) / 1000)
+    except BenchError as e:
+        print(f"FAIL: {e}")
+        sys.exit(1)
+
+    cli_ms = statistics.median(import_ms) - statistics.median(bare_import_ms)
+    print(f"runs: {args.runs}, wall median: {statistics.median(wall_times):.1f} ms, "
+          f"import median: {cli_ms:.1f} ms (budget {args.budget_ms:.1f} ms)")
+    if cli_ms > args.budget_ms:
+        print("FAIL: import time over budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()